@@ -2,16 +2,25 @@
 FastAPI application for Onyx Trust Registry service.
 """
 
+import os
+from functools import lru_cache
 from typing import Any
 
-from fastapi import FastAPI, HTTPException, Query, status
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Response, status
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
+from onyx.api_models import KYBVerificationRequest, KYBVerificationResponse
 from onyx.ce import create_kyb_verified_payload, emit_kyb_verified_ce, get_trace_id
 from onyx.kyb import validate_kyb_payload, verify_kyb
 from onyx.mcp.server import mcp_router
 from onyx.trust_registry import get_trust_registry
 
+# OpenAPI schema generation and the /docs routes are useful in development
+# but pure overhead in production; allow deployments to switch them off.
+_DOCS_ENABLED = os.getenv("ONYX_ENABLE_DOCS", "true").lower() in {"1", "true", "yes"}
+
 # Create FastAPI application
 app = FastAPI(
     title="Onyx Trust Registry",
@@ -26,70 +35,91 @@ app = FastAPI(
         "name": "MIT",
         "url": "https://opensource.org/licenses/MIT",
     },
+    default_response_class=ORJSONResponse,
+    openapi_url="/openapi.json" if _DOCS_ENABLED else None,
+    docs_url="/docs" if _DOCS_ENABLED else None,
+    redoc_url="/redoc" if _DOCS_ENABLED else None,
 )
 
+# Compress larger JSON payloads (provider lists, KYB check details);
+# minimum_size keeps tiny responses like /health uncompressed.
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
 # Include MCP router
 app.include_router(mcp_router)
 
 
-class KYBVerificationRequest(BaseModel):
-    """KYB verification request model."""
-
-    entity_id: str = Field(..., description="Unique identifier for the business entity")
-    business_name: str = Field(..., description="Legal business name")
-    jurisdiction: str = Field(..., description="Country/jurisdiction of registration")
-    entity_age_days: int = Field(..., ge=0, description="Age of entity in days")
-    registration_status: str = Field(
-        "unknown", description="Current registration status"
-    )
-    sanctions_flags: list[str] = Field(
-        default_factory=list, description="List of sanctions-related flags"
-    )
-    business_type: str = Field("unknown", description="Type of business entity")
-    registration_number: str = Field("", description="Official registration number")
-
-
-class KYBVerificationResponse(BaseModel):
-    """KYB verification response model."""
-
-    status: str = Field(..., description="Overall verification status")
-    checks: list[dict[str, Any]] = Field(
-        ..., description="Individual verification checks"
-    )
-    reason: str = Field(..., description="Human-readable reason for the status")
-    entity_id: str = Field(..., description="Entity identifier")
-    verified_at: str = Field(..., description="Verification timestamp")
-    metadata: dict[str, Any] = Field(..., description="Verification metadata")
+# Pre-serialized health payload; liveness probes hit /health constantly, so
+# each request is a plain buffer send with no dict allocation or encode.
+_HEALTH_BYTES = orjson.dumps({"ok": True, "repo": "onyx"})
 
 
 @app.get("/health")
-async def health_check() -> dict[str, Any]:
+async def health_check() -> Response:
     """
     Health check endpoint.
 
     Returns:
-        dict: Health status information
+        Response: Pre-serialized health status information
     """
-    return {"ok": True, "repo": "onyx"}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @app.get("/trust/providers")
-async def list_trusted_providers() -> dict[str, Any]:
+async def list_trusted_providers(
+    stream: bool = Query(False, description="Stream providers as NDJSON lines"),
+) -> Any:
     """
     List all trusted credential providers.
 
+    Args:
+        stream: When true, stream one provider per NDJSON line followed by
+                a final stats line instead of one JSON blob. Keeps peak
+                memory and time-to-first-byte flat for large registries.
+
     Returns:
-        dict: List of trusted provider IDs
+        dict or NDJSON stream: List of trusted provider IDs
     """
     registry = get_trust_registry()
     providers = registry.list_providers()
     stats = registry.get_stats()
 
+    if stream:
+
+        async def _emit():  # type: ignore[no-untyped-def]
+            for provider in providers:
+                yield orjson.dumps({"provider": provider}) + b"\n"
+            yield orjson.dumps({"count": len(providers), "stats": stats}) + b"\n"
+
+        return StreamingResponse(_emit(), media_type="application/x-ndjson")
+
     return {"providers": providers, "count": len(providers), "stats": stats}
 
 
+@lru_cache(maxsize=4096)
+def _provider_response(provider_id: str, registry_version: int) -> bytes:
+    """
+    Build the serialized /trust/allowed response for a provider.
+
+    registry_version participates in the cache key so entries invalidate
+    whenever the registry contents change.
+    """
+    allowed = get_trust_registry().is_allowed(provider_id)
+    return orjson.dumps(
+        {
+            "provider_id": provider_id,
+            "allowed": allowed,
+            "reason": (
+                "Provider is in trust registry"
+                if allowed
+                else "Provider not found in trust registry"
+            ),
+        }
+    )
+
+
 @app.get("/trust/allowed/{provider_id}")
-async def check_provider_allowed(provider_id: str) -> dict[str, Any]:
+async def check_provider_allowed(provider_id: str) -> Response:
     """
     Check if a specific provider is allowed in the trust registry.
 
@@ -97,30 +127,29 @@ async def check_provider_allowed(provider_id: str) -> dict[str, Any]:
         provider_id: Unique identifier for the provider
 
     Returns:
-        dict: Provider status information
+        Response: Provider status information
     """
     registry = get_trust_registry()
-    allowed = registry.is_allowed(provider_id)
-
-    return {
-        "provider_id": provider_id,
-        "allowed": allowed,
-        "reason": (
-            "Provider is in trust registry"
-            if allowed
-            else "Provider not found in trust registry"
-        ),
-    }
+    return Response(
+        content=_provider_response(provider_id, registry.version),
+        media_type="application/json",
+    )
 
 
-@app.post("/kyb/verify", response_model=KYBVerificationResponse)
-async def verify_kyb_endpoint(
+# The response is assembled entirely from trusted internal code, so the
+# KYBVerificationResponse schema is declared for OpenAPI only; skipping
+# response_model validation avoids re-walking every field on the way out.
+@app.post("/kyb/verify", responses={200: {"model": KYBVerificationResponse}})
+def verify_kyb_endpoint(
     request: KYBVerificationRequest,
     emit_ce: bool = Query(False, description="Emit CloudEvent for KYB verification"),
 ) -> dict[str, Any]:
     """
     Perform KYB (Know Your Business) verification with deterministic rule-based checks.
 
+    Declared sync so FastAPI runs the CPU-bound rule evaluation in its
+    threadpool instead of blocking the event loop.
+
     Args:
         request: KYB verification request with entity information
         emit_ce: Whether to emit CloudEvent for the verification
@@ -129,38 +158,39 @@ async def verify_kyb_endpoint(
         KYB verification response with status, checks, and reason
     """
     try:
-        # Validate and normalize inputs
-        validated_payload = validate_kyb_payload(request.model_dump())
-
-        # Perform KYB verification
-        verification_result = verify_kyb(validated_payload)
-
-        # Create response dictionary
-        response_dict = {
-            "status": verification_result["status"],
-            "checks": verification_result["checks"],
-            "reason": verification_result["reason"],
-            "entity_id": verification_result["entity_id"],
-            "verified_at": verification_result["verified_at"],
-            "metadata": verification_result["metadata"],
-        }
+        # Validate and normalize inputs. Pydantic v2 keeps validated field
+        # values in __dict__, so it can be passed as a mapping directly
+        # without a model_dump() serializer walk.
+        validated_payload = validate_kyb_payload(request.__dict__)
+
+        # Perform KYB verification (payload was normalized above)
+        verification_result = verify_kyb(validated_payload, _normalized=True)
 
         # Emit CloudEvent if requested
         if emit_ce:
             trace_id = get_trace_id()
+            # Snapshot the result before the event is attached back onto it
+            # below; embedding verification_result itself would create a
+            # cycle (result -> cloud_event -> data -> result) that the JSON
+            # encoder cannot serialize.
             ce_payload = create_kyb_verified_payload(
-                verification_result, validated_payload
+                dict(verification_result), validated_payload
             )
             ce_event = emit_kyb_verified_ce(trace_id, ce_payload)
 
             # Add CloudEvent to response (for testing purposes)
             # In production, this would be emitted to an event bus
-            response_dict["cloud_event"] = ce_event
-            response_dict["trace_id"] = trace_id
+            verification_result["cloud_event"] = ce_event
+            verification_result["trace_id"] = trace_id
 
-        return response_dict
+        # verify_kyb already produces the documented response shape; the
+        # KYBVerificationResponse schema above is OpenAPI-only, so the dict
+        # is serialized as-is without a validation pass.
+        return verification_result
 
-    except Exception as e:
+    except (ValueError, TypeError, KeyError) as e:
+        # Only translate expected validation/domain errors; anything else
+        # bubbles to FastAPI's default 500 handler with a full traceback.
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing KYB verification request: {str(e)}",
@@ -168,7 +198,31 @@ async def verify_kyb_endpoint(
 
 
 def main() -> None:
-    """Main entry point for running the application."""
+    """Main entry point for running the application in production.
+
+    Runs one worker per CPU with access logging disabled; use main_dev()
+    for the auto-reloading development server.
+    """
+    import uvicorn
+
+    uvicorn.run(
+        "onyx.api:app",
+        host="127.0.0.1",
+        port=8000,
+        workers=os.cpu_count(),
+        log_level="warning",
+        access_log=False,
+        proxy_headers=True,
+        server_header=False,
+        # Request the uvloop event loop and httptools parser explicitly so a
+        # slim install cannot silently fall back to asyncio + h11.
+        loop="uvloop",
+        http="httptools",
+    )
+
+
+def main_dev() -> None:
+    """Development entry point with auto-reload and verbose logging."""
     import uvicorn
 
     uvicorn.run(
@@ -177,6 +231,8 @@ def main() -> None:
         port=8000,
         reload=True,
         log_level="info",
+        loop="uvloop",
+        http="httptools",
     )
 
 
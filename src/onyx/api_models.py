@@ -0,0 +1,47 @@
+"""
+Pydantic request/response models for the Onyx API.
+
+Kept in their own module so api.py stays focused on routing and the
+pydantic-core schema compilation cost is isolated from the app wiring.
+"""
+
+from collections.abc import Mapping
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class KYBVerificationRequest(BaseModel):
+    """KYB verification request model."""
+
+    # Reject unknown fields up front instead of carrying an extras dict
+    # through validation, and skip per-assignment revalidation.
+    model_config = ConfigDict(extra="forbid", validate_assignment=False)
+
+    entity_id: str = Field(..., description="Unique identifier for the business entity")
+    business_name: str = Field(..., description="Legal business name")
+    jurisdiction: str = Field(..., description="Country/jurisdiction of registration")
+    entity_age_days: int = Field(..., ge=0, description="Age of entity in days")
+    registration_status: str = Field(
+        "unknown", description="Current registration status"
+    )
+    sanctions_flags: list[str] = Field(
+        default_factory=list, description="List of sanctions-related flags"
+    )
+    business_type: str = Field("unknown", description="Type of business entity")
+    registration_number: str = Field("", description="Official registration number")
+
+
+class KYBVerificationResponse(BaseModel):
+    """KYB verification response model."""
+
+    status: str = Field(..., description="Overall verification status")
+    checks: list[dict[str, Any]] = Field(
+        ..., description="Individual verification checks"
+    )
+    reason: str = Field(..., description="Human-readable reason for the status")
+    entity_id: str = Field(..., description="Entity identifier")
+    verified_at: str = Field(..., description="Verification timestamp")
+    # Mapping (rather than dict) is treated as read-only by Pydantic, so the
+    # internally-built metadata dict is passed through without a defensive copy.
+    metadata: Mapping[str, Any] = Field(..., description="Verification metadata")
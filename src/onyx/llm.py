@@ -0,0 +1,295 @@
+"""
+Onyx LLM explanation module.
+
+Provides human-readable explanations for trust decisions. When Azure
+OpenAI credentials are configured the explainer is ready for real LLM
+calls; otherwise it falls back to a deterministic stub explanation.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, ClassVar
+
+
+@dataclass(frozen=True, slots=True)
+class TrustPromptData:
+    """
+    Flattened view of a trust decision payload.
+
+    Parsed once per explanation so the prompt builder and cache
+    fingerprint read slot attributes instead of repeating nested dict
+    lookups (trust_data["context_features"]["..."] is three hash probes
+    per access).
+    """
+
+    trust_score: float
+    risk_level: str
+    device_reputation: float
+    velocity: float
+    ip_risk: float
+    history_len: int
+    rail_adjustments: Any
+
+    @classmethod
+    def from_trust_data(cls, trust_data: dict[str, Any]) -> "TrustPromptData":
+        """Build a TrustPromptData from a raw trust decision dictionary."""
+        features = trust_data.get("context_features", {})
+        return cls(
+            trust_score=float(trust_data.get("trust_score", 0.0)),
+            risk_level=str(trust_data.get("risk_level", "unknown")),
+            device_reputation=float(features.get("device_reputation", 1.0)),
+            velocity=float(features.get("velocity", 0.0)),
+            ip_risk=float(features.get("ip_risk", 0.0)),
+            history_len=int(features.get("history_len", 0)),
+            rail_adjustments=trust_data.get("rail_adjustments"),
+        )
+
+
+class TrustLLMExplainer:
+    """
+    Generates human-readable explanations for trust decisions.
+
+    Reads Azure OpenAI configuration from the environment once at
+    construction; explanation generation is deterministic until the real
+    Azure OpenAI call is wired in.
+    """
+
+    # Static prompt scaffold, built once. Keeping the instruction prefix
+    # byte-identical across calls makes it eligible for provider-side
+    # prefix caching once the real Azure OpenAI call lands, and avoids
+    # re-rendering ~1KB of constant text per request.
+    _PROMPT_PREFIX: ClassVar[str] = (
+        "You are an expert trust and risk analyst for the Open Checkout "
+        "Network (OCN). Explain the following trust decision in clear, "
+        "non-technical language for a merchant operations team.\n\n"
+        "Guidelines:\n"
+        "- Lead with the overall assessment and its main driver.\n"
+        "- Mention each contributing factor at most once.\n"
+        "- Do not speculate beyond the data provided.\n\n"
+        "Trust decision:\n"
+    )
+
+    def __init__(self) -> None:
+        """Initialize the explainer from Azure OpenAI environment variables."""
+        self.azure_endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
+        self.azure_api_key = os.getenv("AZURE_OPENAI_API_KEY")
+        self.azure_deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT")
+        self.azure_api_version = os.getenv(
+            "AZURE_OPENAI_API_VERSION", "2024-02-15-preview"
+        )
+        self.is_configured = bool(
+            self.azure_endpoint and self.azure_api_key and self.azure_deployment
+        )
+        # Configuration is immutable after construction, so the status
+        # dict is built once here instead of on every health check.
+        self._configuration_status = {
+            "configured": self.is_configured,
+            "endpoint_set": bool(self.azure_endpoint),
+            "api_key_set": bool(self.azure_api_key),
+            "deployment_set": bool(self.azure_deployment),
+            "api_version": self.azure_api_version,
+        }
+
+    def get_configuration_status(self) -> dict[str, Any]:
+        """
+        Get the Azure OpenAI configuration status.
+
+        Returns:
+            Dictionary describing which configuration pieces are present
+        """
+        return self._configuration_status
+
+    def explain_trust_decision(self, trust_data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Generate a human-readable explanation for a trust decision.
+
+        Args:
+            trust_data: Trust decision data with trust_score, risk_level,
+                        context_features, and rail_adjustments
+
+        Returns:
+            Dictionary with explanation, key_factors, confidence, and
+            model_used
+        """
+        # Only the payload parse can fail; keeping the try narrow stops it
+        # from masking bugs in the prompt/generation path below.
+        # AttributeError covers a non-mapping context_features, whose .get
+        # lookup fails before any field coercion runs.
+        try:
+            data = TrustPromptData.from_trust_data(trust_data)
+        except (TypeError, ValueError, AttributeError) as e:
+            return {
+                "explanation": f"Unable to generate explanation: {e}",
+                "key_factors": [],
+                "confidence": 0.0,
+                "model_used": "error",
+            }
+
+        prompt = self._create_trust_explanation_prompt(data)
+        return self._generate_llm_explanation(prompt, data)
+
+    def explain_trust_decisions(
+        self, trust_data_batch: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        Generate explanations for a batch of trust decisions.
+
+        Entry point for bulk scoring workloads: when the real Azure OpenAI
+        call lands, this packs all prompts into a single request instead of
+        paying one HTTPS round-trip per decision. The stub path funnels
+        each item through the semantic cache.
+
+        Args:
+            trust_data_batch: Trust decision payloads, one per decision
+
+        Returns:
+            One explanation dictionary per payload, in input order
+        """
+        return [self.explain_trust_decision(td) for td in trust_data_batch]
+
+    def _create_trust_explanation_prompt(self, data: TrustPromptData) -> str:
+        """Create the LLM prompt: static prefix plus the dynamic data section."""
+        return self._PROMPT_PREFIX + (
+            f"- Trust score: {data.trust_score}\n"
+            f"- Risk level: {data.risk_level}\n"
+            f"- Device reputation: {data.device_reputation}\n"
+            f"- Transaction velocity: {data.velocity}\n"
+            f"- IP risk: {data.ip_risk}\n"
+            f"- History length: {data.history_len}\n"
+            f"- Rail adjustments: {data.rail_adjustments}\n"
+        )
+
+    def _generate_llm_explanation(
+        self, prompt: str, data: TrustPromptData
+    ) -> dict[str, Any]:
+        """
+        Generate the explanation for a trust decision.
+
+        Results are served from a bounded semantic cache keyed on a
+        quantized fingerprint of the trust data, so repeated or
+        near-identical contexts collapse to a dict lookup. This will save
+        real Azure OpenAI round-trips once the live call is wired in.
+        """
+        return dict(_cached_explanation(*self._fingerprint(data)))
+
+    @staticmethod
+    def _fingerprint(
+        data: TrustPromptData,
+    ) -> tuple[float, str, float, float, float, int]:
+        """
+        Quantize trust data into a coarse, hashable cache key.
+
+        Scores round to two decimals (the precision shown in the
+        explanation text), other features to one decimal.
+        """
+        return (
+            round(data.trust_score, 2),
+            data.risk_level,
+            round(data.device_reputation, 1),
+            round(data.velocity, 1),
+            round(data.ip_risk, 1),
+            data.history_len,
+        )
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the semantic explanation cache (intended for tests)."""
+        _cached_explanation.cache_clear()
+
+
+@lru_cache(maxsize=1024)
+def _cached_explanation(
+    trust_score: float,
+    risk_level: str,
+    device_reputation: float,
+    velocity: float,
+    ip_risk: float,
+    history_len: int,
+) -> dict[str, Any]:
+    """
+    Deterministic stub explanation for a quantized trust fingerprint.
+
+    A real Azure OpenAI call will replace this once credentials handling
+    is production-ready.
+    """
+    key_factors = []
+    if device_reputation < 0.5:
+        key_factors.append("low device reputation")
+    if velocity > 10.0:
+        key_factors.append("high transaction velocity")
+    if ip_risk > 0.5:
+        key_factors.append("elevated IP risk")
+    if history_len < 5:
+        key_factors.append("limited transaction history")
+
+    if key_factors:
+        factor_summary = ", ".join(key_factors)
+        explanation = (
+            f"Trust score {trust_score:.2f} indicates {risk_level} risk, "
+            f"driven by: {factor_summary}."
+        )
+    else:
+        explanation = (
+            f"Trust score {trust_score:.2f} indicates {risk_level} risk "
+            "with no adverse factors detected."
+        )
+
+    return {
+        "explanation": explanation,
+        "key_factors": key_factors,
+        "confidence": 0.85 if key_factors else 0.95,
+        "model_used": "deterministic_stub",
+    }
+
+
+@lru_cache(maxsize=1)
+def _get_explainer() -> TrustLLMExplainer:
+    """
+    Get the shared TrustLLMExplainer instance.
+
+    Memoized so environment reads and configuration checks happen once
+    per process rather than once per request.
+
+    Returns:
+        TrustLLMExplainer instance
+    """
+    return TrustLLMExplainer()
+
+
+def is_trust_llm_configured() -> bool:
+    """
+    Check whether Azure OpenAI explanation support is configured.
+
+    Returns:
+        bool: True if all required Azure OpenAI settings are present
+    """
+    return _get_explainer().is_configured
+
+
+def explain_trust_signal_llm(trust_data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Generate a trust decision explanation (convenience function).
+
+    Args:
+        trust_data: Trust decision data to explain
+
+    Returns:
+        Explanation dictionary from the shared explainer
+    """
+    return _get_explainer().explain_trust_decision(trust_data)
+
+
+def explain_trust_signal_llm_many(
+    trust_data_batch: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """
+    Generate explanations for a batch of trust decisions (convenience function).
+
+    Args:
+        trust_data_batch: Trust decision payloads to explain
+
+    Returns:
+        One explanation dictionary per payload, in input order
+    """
+    return _get_explainer().explain_trust_decisions(trust_data_batch)
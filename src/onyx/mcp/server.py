@@ -4,16 +4,23 @@ MCP (Model Context Protocol) server for Onyx Trust Registry.
 Provides standardized interface for trust registry operations.
 """
 
+import re
+from collections.abc import Callable
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
 
-from onyx.kyb import validate_kyb_payload, verify_kyb
-
 # Create MCP router
 mcp_router = APIRouter(prefix="/mcp", tags=["mcp"])
 
+# Compiled allow/deny patterns for the provider stub. IGNORECASE moves the
+# case-insensitive matching into the C regex engine, so no lowercased copy
+# of the provider ID is allocated per lookup.
+_ALLOW_RE = re.compile(r"^trusted_|verified", re.IGNORECASE)
+_DENY_RE = re.compile(r"^blocked_|suspicious", re.IGNORECASE)
+
 
 class MCPRequest(BaseModel):
     """MCP request model."""
@@ -30,8 +37,83 @@ class MCPResponse(BaseModel):
     error: str | None = None
 
 
-@mcp_router.post("/invoke")
-async def invoke_mcp(request: MCPRequest) -> MCPResponse:
+# getStatus is the liveness probe and its payload never changes, so it is
+# serialized once at import and served as raw bytes with no model construction.
+_STATUS_BYTES = orjson.dumps(
+    {"success": True, "data": {"ok": True, "agent": "onyx"}, "error": None}
+)
+
+
+def _handle_get_status(args: dict[str, Any]) -> Response:
+    """Handle the getStatus verb."""
+    return Response(content=_STATUS_BYTES, media_type="application/json")
+
+
+def _handle_is_allowed_provider(args: dict[str, Any]) -> MCPResponse:
+    """Handle the isAllowedProvider verb."""
+    provider_id = args.get("provider_id")
+    if not provider_id:
+        raise HTTPException(status_code=400, detail="provider_id parameter is required")
+
+    # Stub implementation - deterministic based on provider_id
+    # In real implementation, this would query the trust registry
+    allowed = _is_provider_allowed(provider_id)
+    reason = (
+        "Provider is in trust registry"
+        if allowed
+        else "Provider not found in trust registry"
+    )
+
+    return MCPResponse.model_construct(
+        success=True,
+        data={"allowed": allowed, "provider_id": provider_id, "reason": reason},
+    )
+
+
+def _handle_verify_kyb(args: dict[str, Any]) -> MCPResponse:
+    """Handle the verifyKYB verb."""
+    # Imported lazily so mounting the MCP router alone does not pay the
+    # KYB module's import cost; sys.modules caching makes repeat calls free.
+    from onyx.kyb import validate_kyb_payload, verify_kyb
+
+    # Extract KYB verification parameters from args
+    kyb_payload = {
+        "entity_id": args.get("entity_id", ""),
+        "business_name": args.get("business_name", ""),
+        "jurisdiction": args.get("jurisdiction", ""),
+        "entity_age_days": args.get("entity_age_days", 0),
+        "registration_status": args.get("registration_status", "unknown"),
+        "sanctions_flags": args.get("sanctions_flags", []),
+        "business_type": args.get("business_type", "unknown"),
+        "registration_number": args.get("registration_number", ""),
+    }
+
+    # Validate and normalize inputs
+    validated_payload = validate_kyb_payload(kyb_payload)
+
+    # Perform KYB verification (payload was normalized above)
+    verification_result = verify_kyb(validated_payload, _normalized=True)
+
+    # Copy the result in one C-level pass and rename entity_id to
+    # verification_id instead of rebuilding the dict key by key.
+    data = dict(verification_result)
+    data["verification_id"] = data.pop("entity_id")
+
+    return MCPResponse.model_construct(success=True, data=data)
+
+
+# Verb dispatch table: one O(1) lookup instead of a growing if/elif chain.
+_VERB_HANDLERS: dict[str, Callable[[dict[str, Any]], MCPResponse | Response]] = {
+    "getStatus": _handle_get_status,
+    "isAllowedProvider": _handle_is_allowed_provider,
+    "verifyKYB": _handle_verify_kyb,
+}
+
+
+@mcp_router.post(
+    "/invoke", response_model=None, responses={200: {"model": MCPResponse}}
+)
+async def invoke_mcp(request: MCPRequest) -> MCPResponse | Response:
     """
     MCP invoke endpoint.
 
@@ -46,67 +128,12 @@ async def invoke_mcp(request: MCPRequest) -> MCPResponse:
     Raises:
         HTTPException: For invalid verbs or missing required parameters
     """
-    try:
-        if request.verb == "getStatus":
-            return MCPResponse(success=True, data={"ok": True, "agent": "onyx"})
-
-        elif request.verb == "isAllowedProvider":
-            provider_id = request.args.get("provider_id")
-            if not provider_id:
-                raise HTTPException(
-                    status_code=400, detail="provider_id parameter is required"
-                )
-
-            # Stub implementation - deterministic based on provider_id
-            # In real implementation, this would query the trust registry
-            allowed = _is_provider_allowed(provider_id)
-            reason = (
-                "Provider is in trust registry"
-                if allowed
-                else "Provider not found in trust registry"
-            )
-
-            return MCPResponse(
-                success=True,
-                data={"allowed": allowed, "provider_id": provider_id, "reason": reason},
-            )
-
-        elif request.verb == "verifyKYB":
-            # Extract KYB verification parameters from args
-            kyb_payload = {
-                "entity_id": request.args.get("entity_id", ""),
-                "business_name": request.args.get("business_name", ""),
-                "jurisdiction": request.args.get("jurisdiction", ""),
-                "entity_age_days": request.args.get("entity_age_days", 0),
-                "registration_status": request.args.get(
-                    "registration_status", "unknown"
-                ),
-                "sanctions_flags": request.args.get("sanctions_flags", []),
-                "business_type": request.args.get("business_type", "unknown"),
-                "registration_number": request.args.get("registration_number", ""),
-            }
-
-            # Validate and normalize inputs
-            validated_payload = validate_kyb_payload(kyb_payload)
-
-            # Perform KYB verification
-            verification_result = verify_kyb(validated_payload)
-
-            return MCPResponse(
-                success=True,
-                data={
-                    "verification_id": verification_result["entity_id"],
-                    "status": verification_result["status"],
-                    "checks": verification_result["checks"],
-                    "reason": verification_result["reason"],
-                    "verified_at": verification_result["verified_at"],
-                    "metadata": verification_result["metadata"],
-                },
-            )
-
-        else:
-            raise HTTPException(status_code=400, detail=f"Unknown verb: {request.verb}")
+    handler = _VERB_HANDLERS.get(request.verb)
+    if handler is None:
+        raise HTTPException(status_code=400, detail=f"Unknown verb: {request.verb}")
 
+    try:
+        return handler(request.args)
     except HTTPException:
         raise
     except Exception as e:
@@ -130,17 +157,11 @@ def _is_provider_allowed(provider_id: str) -> bool:
     """
     # Stub logic: allow providers with IDs starting with "trusted_"
     # or containing "verified", deny others
-    provider_lower = provider_id.lower()
-
-    if provider_lower.startswith("trusted_"):
+    if _ALLOW_RE.search(provider_id):
         return True
-    elif "verified" in provider_lower:
-        return True
-    elif provider_lower.startswith("blocked_"):
-        return False
-    elif "suspicious" in provider_lower:
+    if _DENY_RE.search(provider_id):
         return False
-    else:
-        # Default: allow if provider_id length is even, deny if odd
-        # This provides deterministic behavior for testing
-        return len(provider_id) % 2 == 0
+
+    # Default: allow if provider_id length is even, deny if odd
+    # This provides deterministic behavior for testing
+    return len(provider_id) % 2 == 0
@@ -0,0 +1,446 @@
+"""
+Onyx trust signal scoring model.
+
+Deterministic heuristic model that scores a trust context, adjusts
+payment rail weights by risk level and produces a human-readable
+explanation. Feeds the trust signal CloudEvents in onyx.trust_signals.
+"""
+
+import logging
+import math
+import random
+import struct
+import zlib
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+logger = logging.getLogger(__name__)
+
+# Standard OCN rail split used when the caller supplies no weights.
+# Read-only proxy allocated once instead of a fresh dict per request.
+_DEFAULT_WEIGHTS: Mapping[str, float] = MappingProxyType(
+    {"ACH": 0.4, "debit": 0.3, "credit": 0.3}
+)
+_DEFAULT_WEIGHTS_KEY = tuple(_DEFAULT_WEIGHTS.items())
+
+# Rail adjustment factors per risk level, built once at import. Treat the
+# nested dicts as read-only.
+_ADJUSTMENT_FACTORS = {
+    "low": {"ACH": 1.0, "debit": 1.0, "credit": 1.0},
+    "medium": {"ACH": 0.8, "debit": 1.0, "credit": 1.0},
+    "high": {"ACH": 0.3, "debit": 0.7, "credit": 1.0},
+}
+
+
+# Explanation fragments for every combination of the four risk factors,
+# precomputed so factor reporting is one table lookup instead of list
+# building and joining per call. Index bits: device reputation, velocity,
+# IP risk, history.
+_FACTOR_NAMES = (
+    "low device reputation",
+    "high transaction velocity",
+    "elevated IP risk",
+    "limited history",
+)
+_FACTOR_FRAGMENTS = tuple(
+    (
+        " due to "
+        + ", ".join(name for bit, name in enumerate(_FACTOR_NAMES) if mask >> bit & 1)
+        if mask
+        else ""
+    )
+    for mask in range(16)
+)
+
+
+class TrustContext(BaseModel):
+    """Input context for trust scoring."""
+
+    user_id: str = ""
+    session_id: str = ""
+    device_reputation: float = Field(default=1.0, ge=0.0, le=1.0)
+    velocity: float = Field(default=0.0, ge=0.0)
+    ip_risk: float = Field(default=0.0, ge=0.0, le=1.0)
+    history_len: int = Field(default=0, ge=0)
+
+    # Normalized feature vector, always assigned in model_post_init.
+    # Contexts are commonly scored more than once (retries, explainability
+    # passes), so the re-normalization cost is paid a single time.
+    _feature_values: tuple[float, float, float, float] = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute the normalized feature vector for scoring."""
+        self._feature_values = (
+            self.device_reputation,
+            1.0 - min(1.0, self.velocity / 10.0),
+            1.0 - self.ip_risk,
+            min(1.0, self.history_len / 100.0),
+        )
+
+
+class TrustScoreResult(BaseModel):
+    """Result of scoring a trust context."""
+
+    trust_score: float = Field(ge=0.0, le=1.0)
+    risk_level: str
+    confidence: float = Field(ge=0.0, le=1.0)
+    feature_contributions: dict = Field(default_factory=dict)
+
+
+class RailWeightAdjustment(BaseModel):
+    """Risk-based adjustment of a single payment rail weight."""
+
+    rail_type: str
+    original_weight: float
+    adjusted_weight: float
+    reason: str
+
+
+class TrustSignalResponse(BaseModel):
+    """Full trust signal for a request trace."""
+
+    trace_id: str
+    trust_score_result: TrustScoreResult
+    rail_adjustments: list[RailWeightAdjustment] = Field(default_factory=list)
+    explanation: str = ""
+    metadata: dict = Field(default_factory=dict)
+
+
+class TrustSignalMLModel:
+    """
+    Deterministic trust scoring model.
+
+    Scores are a weighted sum of normalized context features plus a small
+    amount of context-derived noise, so identical contexts always produce
+    identical scores for a given seed.
+    """
+
+    def __init__(self, deterministic_seed: int = 42) -> None:
+        """
+        Initialize the model.
+
+        Args:
+            deterministic_seed: Seed mixed into the per-context noise so
+                                runs are reproducible.
+        """
+        self.deterministic_seed = deterministic_seed
+        self.feature_weights = {
+            "device_reputation": 0.35,
+            "velocity": 0.25,
+            "ip_risk": 0.25,
+            "history_len": 0.15,
+        }
+        self.risk_thresholds = {"low": 0.7, "medium": 0.4}
+        # Parallel tuples over the weight dict: the hot path multiplies
+        # positionally instead of iterating dict items, and the dict stays
+        # public API.
+        self._feature_names = tuple(self.feature_weights)
+        self._weights = tuple(self.feature_weights.values())
+        # Threshold scalars cached off the public dict so the per-call
+        # risk banding needs no dict hashing.
+        self._low_threshold = self.risk_thresholds["low"]
+        self._medium_threshold = self.risk_thresholds["medium"]
+        logger.info("Initialized TrustSignalMLModel with seed %d", deterministic_seed)
+
+    def _noise_seed(self, context: TrustContext) -> int:
+        """
+        Derive a deterministic noise seed from the scoring context.
+
+        Packs the numeric features into a fixed struct and runs crc32
+        over the buffer — a non-cryptographic hash that is an order of
+        magnitude cheaper than hashing a stringified model_dump with MD5,
+        while staying stable across processes.
+
+        Args:
+            context: Trust context being scored.
+
+        Returns:
+            Seed in [0, 1000).
+        """
+        # history_len has no upper bound on the model, so it is masked to
+        # 64 bits rather than handed to a fixed-width field that would
+        # raise struct.error on huge values.
+        buf = (
+            struct.pack(
+                "<dddQ",
+                context.device_reputation,
+                context.velocity,
+                context.ip_risk,
+                context.history_len & 0xFFFFFFFFFFFFFFFF,
+            )
+            + context.user_id.encode()
+            + b"\x00"
+            + context.session_id.encode()
+        )
+        return (zlib.crc32(buf) ^ self.deterministic_seed) % 1000
+
+    def score_trust(self, context: TrustContext) -> TrustScoreResult:
+        """
+        Score a trust context.
+
+        Args:
+            context: Trust context to score.
+
+        Returns:
+            TrustScoreResult with score, risk level, confidence and
+            per-feature contributions.
+        """
+        feature_values = context._feature_values
+
+        # One positional pass produces both the contributions (kept for
+        # explainability) and their sum.
+        contributions = [
+            value * weight
+            for value, weight in zip(feature_values, self._weights, strict=True)
+        ]
+        trust_score = sum(contributions)
+
+        # Small deterministic jitter from a local generator; no global
+        # RNG state is touched.
+        noise = random.Random(self._noise_seed(context)).gauss(0.0, 0.05)
+        trust_score = max(0.0, min(1.0, trust_score + noise))
+
+        # Closed-form population stdev over the four features: one sqrt
+        # instead of the statistics module's generic iterable machinery.
+        f0, f1, f2, f3 = feature_values
+        mean = (f0 + f1 + f2 + f3) * 0.25
+        feature_std = math.sqrt(
+            ((f0 - mean) ** 2 + (f1 - mean) ** 2 + (f2 - mean) ** 2 + (f3 - mean) ** 2)
+            * 0.25
+        )
+        confidence = max(0.0, min(1.0, 1.0 - feature_std))
+
+        risk_level = (
+            "low"
+            if trust_score >= self._low_threshold
+            else "medium" if trust_score >= self._medium_threshold else "high"
+        )
+
+        feature_contributions = dict(
+            zip(self._feature_names, contributions, strict=True)
+        )
+
+        # Values are clamped/derived above, so validation is skipped on
+        # this internally-built result.
+        return TrustScoreResult.model_construct(
+            trust_score=trust_score,
+            risk_level=risk_level,
+            confidence=confidence,
+            feature_contributions=feature_contributions,
+        )
+
+    def score_trust_batch(self, contexts: list[TrustContext]) -> list[TrustScoreResult]:
+        """
+        Score a batch of trust contexts.
+
+        Single entry point for bulk scoring workloads: one Python call
+        per batch instead of per context, with the method lookup hoisted
+        out of the loop.
+
+        Args:
+            contexts: Trust contexts to score.
+
+        Returns:
+            One TrustScoreResult per context, in input order.
+        """
+        score = self.score_trust
+        return [score(context) for context in contexts]
+
+    def calculate_rail_adjustments(
+        self, risk_level: str, original_weights: Mapping[str, float]
+    ) -> list[RailWeightAdjustment]:
+        """
+        Adjust payment rail weights based on the assessed risk level.
+
+        Args:
+            risk_level: Risk level from score_trust (low/medium/high).
+            original_weights: Mapping of rail type to original weight.
+
+        Returns:
+            Normalized weight adjustments, one per rail.
+        """
+        factors = _ADJUSTMENT_FACTORS.get(risk_level, _ADJUSTMENT_FACTORS["high"])
+
+        # Two linear passes: apply the factors once, then normalize with a
+        # single precomputed total instead of re-summing per rail.
+        adjusted = {
+            rail_type: weight * factors.get(rail_type, 1.0)
+            for rail_type, weight in original_weights.items()
+        }
+        total_adjusted = sum(adjusted.values())
+        scale = 1.0 / total_adjusted if total_adjusted else 0.0
+        reason = f"{risk_level} risk adjustment"
+
+        return [
+            RailWeightAdjustment.model_construct(
+                rail_type=rail_type,
+                original_weight=original_weights[rail_type],
+                adjusted_weight=weight * scale,
+                reason=reason,
+            )
+            for rail_type, weight in adjusted.items()
+        ]
+
+    def generate_trust_explanation(
+        self, context: TrustContext, result: TrustScoreResult
+    ) -> str:
+        """
+        Generate a human-readable explanation for a trust score.
+
+        Args:
+            context: Trust context that was scored.
+            result: Scoring result to explain.
+
+        Returns:
+            Explanation string.
+        """
+        # Pack the four independent predicates into a bitmask and look up
+        # the pre-joined fragment; no per-call list build or join.
+        mask = (
+            (context.device_reputation < 0.5)
+            | (context.velocity > 5.0) << 1
+            | (context.ip_risk > 0.7) << 2
+            | (context.history_len < 10) << 3
+        )
+        factors = _FACTOR_FRAGMENTS[mask]
+        return (
+            f"{result.risk_level.capitalize()} risk"
+            f" (score: {result.trust_score:.2f}){factors}."
+        )
+
+
+@lru_cache(maxsize=8)
+def _get_model(deterministic_seed: int) -> TrustSignalMLModel:
+    """
+    Get a shared TrustSignalMLModel for a seed.
+
+    The model holds no per-request state, so constructing (and logging)
+    once per seed removes the constructor from the request path.
+
+    Args:
+        deterministic_seed: Seed for reproducible scoring.
+
+    Returns:
+        TrustSignalMLModel instance.
+    """
+    return TrustSignalMLModel(deterministic_seed)
+
+
+@lru_cache(maxsize=10_000)
+def _cached_signal(
+    user_id: str,
+    session_id: str,
+    device_reputation: float,
+    velocity: float,
+    ip_risk: float,
+    history_len: int,
+    weights_key: tuple[tuple[str, float], ...],
+    deterministic_seed: int,
+) -> TrustSignalResponse:
+    """
+    Build a trust signal template for a (context, weights, seed) triple.
+
+    Scoring is fully deterministic for these inputs, so repeat scorings
+    of the same user/session (retries, reconciliation passes) resolve to
+    a cache hit. The trace_id is left empty and filled in per request by
+    get_trust_signal.
+
+    Returns:
+        TrustSignalResponse template with an empty trace_id.
+    """
+    context = TrustContext(
+        user_id=user_id,
+        session_id=session_id,
+        device_reputation=device_reputation,
+        velocity=velocity,
+        ip_risk=ip_risk,
+        history_len=history_len,
+    )
+    original_weights = dict(weights_key)
+    ml_model = _get_model(deterministic_seed)
+
+    trust_score_result = ml_model.score_trust(context)
+    rail_adjustments = ml_model.calculate_rail_adjustments(
+        trust_score_result.risk_level, original_weights
+    )
+    explanation = ml_model.generate_trust_explanation(context, trust_score_result)
+
+    return TrustSignalResponse.model_construct(
+        trace_id="",
+        trust_score_result=trust_score_result,
+        rail_adjustments=rail_adjustments,
+        explanation=explanation,
+        metadata={
+            "model_seed": deterministic_seed,
+            # Shallow copy of the validated field dict: every TrustContext
+            # field is a scalar, so this matches model_dump() output
+            # without running the pydantic serializer.
+            "context_features": dict(context.__dict__),
+        },
+    )
+
+
+def get_trust_signal(
+    trace_id: str,
+    context: TrustContext,
+    original_weights: Mapping[str, float] | None = None,
+    deterministic_seed: int = 42,
+) -> TrustSignalResponse:
+    """
+    Generate a full trust signal for a request trace.
+
+    Args:
+        trace_id: Trace ID for the request.
+        context: Trust context to score.
+        original_weights: Optional rail weights; defaults to the standard
+                          OCN rail split.
+        deterministic_seed: Seed for reproducible scoring.
+
+    Returns:
+        TrustSignalResponse with score, rail adjustments and explanation.
+    """
+    weights_key = (
+        _DEFAULT_WEIGHTS_KEY
+        if original_weights is None
+        else tuple(original_weights.items())
+    )
+
+    template = _cached_signal(
+        context.user_id,
+        context.session_id,
+        context.device_reputation,
+        context.velocity,
+        context.ip_risk,
+        context.history_len,
+        weights_key,
+        deterministic_seed,
+    )
+    # Shallow copy with the caller's trace ID so cache hits never leak a
+    # stale trace to downstream consumers.
+    response = template.model_copy(update={"trace_id": trace_id})
+
+    # Lazy %-style formatting: the floats are only rendered when INFO is
+    # actually enabled.
+    logger.info(
+        "Trust signal generated for trace %s: score=%.3f, risk=%s",
+        trace_id,
+        response.trust_score_result.trust_score,
+        response.trust_score_result.risk_level,
+    )
+
+    return response
+
+
+def get_cache_stats() -> dict[str, int]:
+    """
+    Get hit/miss statistics for the trust signal cache.
+
+    Returns:
+        Dictionary with hits, misses and current cache size.
+    """
+    info = _cached_signal.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
@@ -4,10 +4,57 @@ Trust Registry v0 implementation for Onyx.
 Provides allowlist functionality for credential providers.
 """
 
+import itertools
 import os
+import sys
+from functools import lru_cache
 
 import yaml
 
+# Prefer the libyaml C loader; it parses ~5-10x faster than the pure-Python
+# SafeLoader and cuts the registry's cold-start cost. Falls back cleanly
+# when PyYAML was built without libyaml.
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlSafeLoader  # type: ignore[assignment]
+
+
+# Parsed-config cache keyed by (mtime_ns, size) per path: reload() only
+# pays for a re-parse when the file actually changed on disk.
+_YAML_CACHE: dict[str, tuple[tuple[int, int], object]] = {}
+
+# Process-wide version source shared by every TrustRegistry instance. A
+# fresh instance (e.g. after clear_trust_registry_cache) must never reuse
+# a version an earlier instance already published, or downstream caches
+# keyed on (.., version) would serve entries from the old allowlist.
+_VERSION_COUNTER = itertools.count(1)
+
+
+def _read_yaml_config(config_path: str) -> object:
+    """
+    Parse a YAML config file, reusing the cached parse when unchanged.
+
+    Args:
+        config_path: Path to the YAML configuration file
+
+    Returns:
+        Parsed YAML document (treat as read-only).
+    """
+    stat = os.stat(config_path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _YAML_CACHE.get(config_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    # Binary read hands raw bytes to the C loader, skipping the text-mode
+    # decode and newline-translation layer.
+    with open(config_path, "rb") as f:
+        config = yaml.load(f.read(), Loader=_YamlSafeLoader)
+
+    _YAML_CACHE[config_path] = (key, config)
+    return config
+
 
 class TrustRegistry:
     """
@@ -27,6 +74,8 @@ class TrustRegistry:
         """
         self.config_path = config_path
         self._providers: set[str] = set()
+        self._version = next(_VERSION_COUNTER)
+        self._sorted_cache: list[str] | None = None
         self._load_allowlist()
 
     def _load_allowlist(self) -> None:
@@ -44,8 +93,7 @@ class TrustRegistry:
             config_path: Path to the YAML configuration file
         """
         try:
-            with open(config_path, encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            config = _read_yaml_config(config_path)
 
             if not isinstance(config, dict):
                 raise ValueError("YAML config must be a dictionary")
@@ -60,9 +108,9 @@ class TrustRegistry:
                     provider_id = provider.get("id")
                     if not provider_id or not isinstance(provider_id, str):
                         raise ValueError(f"Invalid provider entry: {provider}")
-                    self._providers.add(provider_id)
+                    self._providers.add(sys.intern(provider_id.strip()))
                 elif isinstance(provider, str):
-                    self._providers.add(provider)
+                    self._providers.add(sys.intern(provider.strip()))
                 else:
                     raise ValueError(f"Invalid provider entry: {provider}")
 
@@ -81,6 +129,18 @@ class TrustRegistry:
             "licensed_lender_005",
         }
 
+    @property
+    def version(self) -> int:
+        """
+        Monotonic counter bumped on every allowlist mutation.
+
+        Versions are unique across all registry instances in the process,
+        so callers can use it as a cache key that invalidates whenever the
+        registry contents change — including when the memoized instance is
+        rebuilt via clear_trust_registry_cache().
+        """
+        return self._version
+
     def is_allowed(self, provider_id: str | None) -> bool:
         """
         Check if a provider is in the allowlist.
@@ -91,10 +151,16 @@ class TrustRegistry:
         Returns:
             bool: True if provider is allowed, False otherwise
         """
-        if not isinstance(provider_id, str) or not provider_id.strip():
+        # Fast path: stored IDs are always stripped, so a well-formed
+        # provider_id resolves with a single set lookup and no string copies.
+        if provider_id in self._providers:
+            return True
+
+        if not isinstance(provider_id, str):
             return False
 
-        return provider_id.strip() in self._providers
+        stripped = provider_id.strip()
+        return bool(stripped) and stripped in self._providers
 
     def list_providers(self) -> list[str]:
         """
@@ -103,7 +169,11 @@ class TrustRegistry:
         Returns:
             List of provider IDs in alphabetical order
         """
-        return sorted(self._providers)
+        # The allowlist is mostly static, so the sorted view is computed
+        # once and invalidated on mutation instead of re-sorting per call.
+        if self._sorted_cache is None:
+            self._sorted_cache = sorted(self._providers)
+        return self._sorted_cache
 
     def add_provider(self, provider_id: str | None) -> bool:
         """
@@ -118,11 +188,13 @@ class TrustRegistry:
         if not isinstance(provider_id, str) or not provider_id.strip():
             return False
 
-        provider_id = provider_id.strip()
+        provider_id = sys.intern(provider_id.strip())
         if provider_id in self._providers:
             return False
 
         self._providers.add(provider_id)
+        self._version = next(_VERSION_COUNTER)
+        self._sorted_cache = None
         return True
 
     def remove_provider(self, provider_id: str | None) -> bool:
@@ -143,11 +215,15 @@ class TrustRegistry:
             return False
 
         self._providers.remove(provider_id)
+        self._version = next(_VERSION_COUNTER)
+        self._sorted_cache = None
         return True
 
     def reload(self) -> None:
         """Reload the allowlist from the configuration file."""
         self._providers.clear()
+        self._version = next(_VERSION_COUNTER)
+        self._sorted_cache = None
         self._load_allowlist()
 
     def get_stats(self) -> dict[str, int]:
@@ -164,10 +240,14 @@ class TrustRegistry:
 
 
 # Global instance for the application
+@lru_cache(maxsize=1)
 def get_trust_registry() -> TrustRegistry:
     """
     Get the global Trust Registry instance.
 
+    The instance is memoized so the config file is read once per process
+    instead of on every request; call reload() to pick up config changes.
+
     Returns:
         TrustRegistry instance
     """
@@ -175,6 +255,17 @@ def get_trust_registry() -> TrustRegistry:
     return TrustRegistry(config_path)
 
 
+def clear_trust_registry_cache() -> None:
+    """
+    Drop the memoized Trust Registry instance.
+
+    The next get_trust_registry() call re-reads TRUST_REGISTRY_CONFIG and
+    reloads the allowlist from disk. Intended for tests and SIGHUP-style
+    config reloads.
+    """
+    get_trust_registry.cache_clear()
+
+
 # Convenience functions for common operations
 def is_provider_allowed(provider_id: str) -> bool:
     """
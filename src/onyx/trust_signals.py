@@ -0,0 +1,369 @@
+"""
+Onyx trust signal CloudEvents module.
+
+Provides utilities for building, emitting and validating
+ocn.onyx.trust_signal.v1 CloudEvents. Events are returned to the caller
+today; publishing to the OCN event bus lands with Phase 2 wiring.
+"""
+
+import os
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+
+class TrustSignalData(BaseModel):
+    """Data payload for a trust signal CloudEvent."""
+
+    # The container fields are annotated as bare dict/list so pydantic
+    # checks the container type without walking every element; their
+    # contents come straight from the scoring engine and are validated
+    # there. validate_default/validate_assignment stay off the hot path.
+    model_config = ConfigDict(validate_assignment=False, validate_default=False)
+
+    trace_id: str
+    trust_score: float
+    risk_level: str
+    confidence: float
+    feature_contributions: dict = Field(default_factory=dict)
+    rail_candidates: list = Field(default_factory=list)
+    rail_adjustments: list = Field(default_factory=list)
+    adjusted_weights: dict = Field(default_factory=dict)
+    generated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+
+class TrustSignalEvent(BaseModel):
+    """CloudEvent envelope for a trust signal."""
+
+    specversion: str = "1.0"
+    type: str = "ocn.onyx.trust_signal.v1"
+    source: str = "onyx-trust-registry"
+    id: str
+    time: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    subject: str
+    datacontenttype: str = "application/json"
+    data: TrustSignalData
+
+
+# Event IDs share this prefix everywhere: the schema pattern, the emitter
+# and the validator fast path are all derived from the one constant so
+# they cannot drift.
+_EVENT_ID_PREFIX = "trust-signal-"
+
+# JSON Schema for ocn.onyx.trust_signal.v1, built once at import. Callers
+# get the shared dict back; rebuilding it per call only re-allocated the
+# same constant structure.
+_TRUST_SIGNAL_EVENT_SCHEMA: dict[str, Any] = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "ocn.onyx.trust_signal.v1",
+    "type": "object",
+    "required": [
+        "specversion",
+        "type",
+        "source",
+        "id",
+        "time",
+        "subject",
+        "datacontenttype",
+        "data",
+    ],
+    "properties": {
+        "specversion": {"const": "1.0"},
+        "type": {"const": "ocn.onyx.trust_signal.v1"},
+        "source": {"pattern": "^onyx-trust-registry$"},
+        "id": {"type": "string", "pattern": f"^{_EVENT_ID_PREFIX}.*$"},
+        "time": {"type": "string", "format": "date-time"},
+        "subject": {"type": "string", "minLength": 1},
+        "datacontenttype": {"const": "application/json"},
+        "data": {
+            "type": "object",
+            "required": ["trace_id", "trust_score", "risk_level", "confidence"],
+            "properties": {
+                "trace_id": {"type": "string", "minLength": 1},
+                "trust_score": {"type": "number", "minimum": 0.0, "maximum": 1.0},
+                "risk_level": {"enum": ["low", "medium", "high"]},
+                "confidence": {"type": "number", "minimum": 0.0, "maximum": 1.0},
+                "feature_contributions": {"type": "object"},
+                "rail_candidates": {"type": "array"},
+                "rail_adjustments": {"type": "array"},
+                "adjusted_weights": {"type": "object"},
+                "generated_at": {"type": "string", "format": "date-time"},
+            },
+        },
+    },
+}
+
+
+# Constant attribute values every trust signal event must carry, plus the
+# allowed risk levels as a frozenset for hashed membership instead of a
+# per-call list scan.
+_EVENT_EXPECTED_ATTRS = (
+    "1.0",
+    "ocn.onyx.trust_signal.v1",
+    "onyx-trust-registry",
+    "application/json",
+)
+_VALID_RISK_LEVELS = frozenset({"low", "medium", "high"})
+
+# Shared serializer for event publishing. dump_json goes straight from
+# model to JSON bytes in pydantic-core, skipping the model -> dict ->
+# json.dumps round trip.
+_EVENT_ADAPTER: TypeAdapter[Any] = TypeAdapter(TrustSignalEvent)
+
+
+def serialize_event_json(event: TrustSignalEvent) -> bytes:
+    """
+    Serialize a trust signal event to JSON bytes for publishing.
+
+    Args:
+        event: Trust signal event to serialize.
+
+    Returns:
+        JSON-encoded event bytes.
+    """
+    return _EVENT_ADAPTER.dump_json(event)
+
+
+def get_trust_signal_event_schema() -> dict[str, Any]:
+    """
+    Get the JSON Schema for ocn.onyx.trust_signal.v1 events.
+
+    Returns:
+        The shared schema dictionary (treat as read-only).
+    """
+    return _TRUST_SIGNAL_EVENT_SCHEMA
+
+
+# Standard OCN rail set used when the caller does not supply candidates.
+# Kept as a module-level tuple so the default path reuses the same three
+# dicts instead of re-allocating them per payload; treat entries as
+# read-only.
+_DEFAULT_RAIL_CANDIDATES: tuple[dict[str, Any], ...] = (
+    {"rail_type": "ACH", "base_weight": 0.4},
+    {"rail_type": "Card", "base_weight": 0.4},
+    {"rail_type": "Wire", "base_weight": 0.2},
+)
+
+
+def _build_trust_signal_fields(
+    trust_result: dict[str, Any],
+    rail_candidates: list[dict[str, Any]] | None,
+) -> dict[str, Any]:
+    """Assemble the TrustSignalData field dict from a trust scoring result."""
+    if rail_candidates is None:
+        # Shallow copy: a fresh list shell over the shared candidate dicts.
+        rail_candidates = list(_DEFAULT_RAIL_CANDIDATES)
+
+    # Hoist the nested sub-dict once and build both adjustment outputs in
+    # a single pass instead of four repeated lookups and two loops.
+    score_result = trust_result.get("trust_score_result", {})
+    adjustments = trust_result.get("rail_adjustments", [])
+
+    adjusted_weights: dict[str, float] = {}
+    adjustment_copies: list[dict[str, Any]] = []
+    for adj in adjustments:
+        adjustment_copies.append(dict(adj))
+        if "rail_type" in adj and "adjusted_weight" in adj:
+            adjusted_weights[adj["rail_type"]] = adj["adjusted_weight"]
+
+    return {
+        "trace_id": trust_result.get("trace_id", ""),
+        "trust_score": score_result.get("trust_score", 0.0),
+        "risk_level": score_result.get("risk_level", "unknown"),
+        "confidence": score_result.get("confidence", 0.0),
+        "feature_contributions": score_result.get("feature_contributions", {}),
+        "rail_candidates": rail_candidates,
+        "rail_adjustments": adjustment_copies,
+        "adjusted_weights": adjusted_weights,
+    }
+
+
+def create_trust_signal_payload(
+    trust_result: dict[str, Any],
+    rail_candidates: list[dict[str, Any]] | None = None,
+    validate: bool = True,
+) -> TrustSignalData:
+    """
+    Create a trust signal data payload from a trust scoring result.
+
+    Args:
+        trust_result: Trust scoring result with trace_id, a
+                      trust_score_result sub-dict (trust_score, risk_level,
+                      confidence, feature_contributions) and a
+                      rail_adjustments list.
+        rail_candidates: Optional payment rail candidates; defaults to the
+                         standard OCN rail set.
+        validate: When False, skip pydantic field validation via
+                  model_construct. Safe for internally-built results that
+                  are emitted straight to the event bus.
+
+    Returns:
+        TrustSignalData payload.
+    """
+    fields = _build_trust_signal_fields(trust_result, rail_candidates)
+    if validate:
+        return TrustSignalData(**fields)
+    return TrustSignalData.model_construct(**fields)
+
+
+def emit_trust_signal_event(trace_id: str, data: TrustSignalData) -> TrustSignalEvent:
+    """
+    Emit a CloudEvent for a trust signal.
+
+    Args:
+        trace_id: Trace ID for the request.
+        data: Trust signal data payload.
+
+    Returns:
+        TrustSignalEvent envelope.
+    """
+    # time_ns is a single clock read with no datetime allocation, and the
+    # random suffix keeps IDs unique across concurrent emits in the same
+    # nanosecond tick.
+    event_id = f"{_EVENT_ID_PREFIX}{trace_id}-{time.time_ns()}-{os.urandom(4).hex()}"
+    return TrustSignalEvent(id=event_id, subject=trace_id, data=data)
+
+
+def emit_trust_signal_event_dict(
+    trace_id: str,
+    trust_result: dict[str, Any],
+    rail_candidates: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """
+    Emit a trust signal CloudEvent as a plain dictionary.
+
+    Fast path for callers that only log or forward the envelope: builds
+    the event dict directly from the scoring result without constructing
+    TrustSignalData/TrustSignalEvent models, in the same style as
+    ce.emit_kyb_verified_ce. Use emit_trust_signal_event when a typed
+    model is actually needed.
+
+    Args:
+        trace_id: Trace ID for the request.
+        trust_result: Trust scoring result (see create_trust_signal_payload).
+        rail_candidates: Optional payment rail candidates.
+
+    Returns:
+        CloudEvent envelope in structured content mode.
+    """
+    data = _build_trust_signal_fields(trust_result, rail_candidates)
+    data["generated_at"] = datetime.now(UTC).isoformat()
+    return {
+        "specversion": "1.0",
+        "type": "ocn.onyx.trust_signal.v1",
+        "source": "onyx-trust-registry",
+        "id": f"{_EVENT_ID_PREFIX}{trace_id}-{time.time_ns()}-{os.urandom(4).hex()}",
+        "time": datetime.now(UTC).isoformat(),
+        "subject": trace_id,
+        "datacontenttype": "application/json",
+        "data": data,
+    }
+
+
+class TrustEventEmitter:
+    """
+    Buffers trust signal events and publishes them in batches.
+
+    Per-event publishing pays broker round-trip and flush cost on every
+    message; buffering amortizes serialization and network overhead while
+    preserving emit order. Events are flushed when the buffer reaches
+    flush_every entries or the oldest buffered event exceeds linger_ms.
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[list[bytes]], None] | None = None,
+        flush_every: int = 100,
+        linger_ms: int = 50,
+    ) -> None:
+        """
+        Initialize the emitter.
+
+        Args:
+            publish: Callable receiving a batch of JSON-encoded events.
+                     When None, flushed batches are only returned to the
+                     caller (useful before broker wiring lands).
+            flush_every: Buffer size that triggers a flush.
+            linger_ms: Maximum time an event may sit in the buffer.
+        """
+        self._publish = publish
+        self._flush_every = flush_every
+        self._linger_ns = linger_ms * 1_000_000
+        self._buffer: list[TrustSignalEvent] = []
+        self._oldest_ns = 0
+
+    def emit(self, event: TrustSignalEvent) -> list[bytes]:
+        """
+        Buffer an event, flushing if the batch is full or has lingered.
+
+        Args:
+            event: Trust signal event to publish.
+
+        Returns:
+            The flushed batch of serialized events, or an empty list if
+            the event was only buffered.
+        """
+        if not self._buffer:
+            self._oldest_ns = time.monotonic_ns()
+        self._buffer.append(event)
+
+        if (
+            len(self._buffer) >= self._flush_every
+            or time.monotonic_ns() - self._oldest_ns >= self._linger_ns
+        ):
+            return self.flush()
+        return []
+
+    def flush(self) -> list[bytes]:
+        """
+        Serialize and publish all buffered events.
+
+        Returns:
+            The serialized batch, in emit order.
+        """
+        if not self._buffer:
+            return []
+
+        batch = [serialize_event_json(event) for event in self._buffer]
+        self._buffer.clear()
+        if self._publish is not None:
+            self._publish(batch)
+        return batch
+
+    def close(self) -> list[bytes]:
+        """Flush any remaining events and return the final batch."""
+        return self.flush()
+
+
+def validate_trust_signal_event(event: TrustSignalEvent) -> bool:
+    """
+    Validate a trust signal event against ocn.onyx.trust_signal.v1.
+
+    Args:
+        event: Trust signal event to validate.
+
+    Returns:
+        True if valid, False otherwise.
+    """
+    # Every check is a deterministic boolean on typed model fields, so no
+    # try/except wrapper: short-circuiting keeps the happy path branch-light
+    # and programmer errors surface instead of reading as "invalid event".
+    data = event.data
+    return (
+        (
+            event.specversion,
+            event.type,
+            event.source,
+            event.datacontenttype,
+        )
+        == _EVENT_EXPECTED_ATTRS
+        and event.id.startswith(_EVENT_ID_PREFIX)
+        and bool(event.subject)
+        and bool(data.trace_id)
+        and 0.0 <= data.trust_score <= 1.0
+        and data.risk_level in _VALID_RISK_LEVELS
+        and 0.0 <= data.confidence <= 1.0
+    )
@@ -0,0 +1,60 @@
+"""
+Tests for the KYB verification API endpoint.
+"""
+
+from fastapi.testclient import TestClient
+
+from onyx.api import app
+from onyx.ce import validate_ce_schema
+
+client = TestClient(app)
+
+
+def _sample_request(**overrides: object) -> dict:
+    """Build a baseline KYB verification request body."""
+    body: dict = {
+        "entity_id": "test_entity_001",
+        "business_name": "Acme Corporation Ltd",
+        "jurisdiction": "US",
+        "entity_age_days": 1000,
+        "registration_status": "active",
+        "sanctions_flags": [],
+        "business_type": "corporation",
+        "registration_number": "12345678",
+    }
+    body.update(overrides)
+    return body
+
+
+def test_verify_kyb_endpoint_basic() -> None:
+    """Test POST /kyb/verify returns 200 with the verification result."""
+    response = client.post("/kyb/verify", json=_sample_request())
+
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["status"] == "verified"
+    assert data["entity_id"] == "test_entity_001"
+    assert isinstance(data["checks"], list)
+    assert "cloud_event" not in data
+
+
+def test_verify_kyb_endpoint_emit_ce() -> None:
+    """Test POST /kyb/verify?emit_ce=true attaches a valid CloudEvent."""
+    response = client.post("/kyb/verify?emit_ce=true", json=_sample_request())
+
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["status"] == "verified"
+    assert data["trace_id"]
+
+    ce_event = data["cloud_event"]
+    assert validate_ce_schema(ce_event) is True
+    assert ce_event["subject"] == data["trace_id"]
+
+    # The embedded payload mirrors the verification result without the
+    # attached event itself (no self-reference).
+    embedded = ce_event["data"]["verification_result"]
+    assert embedded["status"] == data["status"]
+    assert "cloud_event" not in embedded
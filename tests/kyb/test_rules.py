@@ -2,7 +2,7 @@
 Tests for KYB verification rules and deterministic behavior.
 """
 
-from onyx.kyb import validate_kyb_payload, verify_kyb
+from onyx.kyb import validate_kyb_payload, verify_kyb, verify_kyb_batch
 
 
 def test_kyb_verification_verified_entity() -> None:
@@ -454,3 +454,46 @@ def test_kyb_verification_multiple_failures() -> None:
     failing_check_names = [check["check_name"] for check in failing_checks]
     assert "jurisdiction_verification" in failing_check_names
     assert "sanctions_screening" in failing_check_names
+
+
+def test_verify_kyb_batch_matches_single_verification() -> None:
+    """Test batch verification returns the same results as per-entity calls."""
+    payloads = [
+        {
+            "entity_id": "batch_entity_001",
+            "business_name": "Acme Corporation Ltd",
+            "jurisdiction": "US",
+            "entity_age_days": 1000,
+            "registration_status": "active",
+            "sanctions_flags": [],
+            "business_type": "corporation",
+        },
+        {
+            "entity_id": "batch_entity_002",
+            "business_name": "Shady Holdings",
+            "jurisdiction": "XX",
+            "entity_age_days": 50,
+            "registration_status": "unknown",
+            "sanctions_flags": ["sanctions"],
+            "business_type": "corporation",
+        },
+    ]
+
+    batch_results = verify_kyb_batch(payloads)
+
+    assert len(batch_results) == len(payloads)
+
+    # All entries in one batch share a single verified_at timestamp
+    assert batch_results[0]["verified_at"] == batch_results[1]["verified_at"]
+
+    for payload, batch_result in zip(payloads, batch_results, strict=True):
+        single_result = verify_kyb(payload)
+        assert batch_result["entity_id"] == payload["entity_id"]
+        assert batch_result["status"] == single_result["status"]
+        assert batch_result["reason"] == single_result["reason"]
+        assert batch_result["checks"] == single_result["checks"]
+
+
+def test_verify_kyb_batch_empty() -> None:
+    """Test batch verification with an empty batch."""
+    assert verify_kyb_batch([]) == []
@@ -2,6 +2,8 @@
 Tests for Trust Registry API endpoints.
 """
 
+import json
+
 from fastapi.testclient import TestClient
 
 from onyx.api import app
@@ -35,6 +37,25 @@ def test_list_trusted_providers() -> None:
     assert "allowlist_size" in data["stats"]
 
 
+def test_list_trusted_providers_stream() -> None:
+    """Test GET /trust/providers?stream=true returns NDJSON lines."""
+    response = client.get("/trust/providers?stream=true")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines() if line]
+
+    # All but the last line carry one provider each
+    providers = [line["provider"] for line in lines[:-1]]
+    assert "trusted_bank_001" in providers
+
+    # Final line carries the count and stats
+    summary = lines[-1]
+    assert summary["count"] == len(providers)
+    assert "total_providers" in summary["stats"]
+
+
 def test_check_provider_allowed_true() -> None:
     """Test GET /trust/allowed/{provider_id} returns 200 for allowed provider."""
     response = client.get("/trust/allowed/trusted_bank_001")
@@ -0,0 +1,145 @@
+"""
+Tests for the trust decision LLM explainer.
+"""
+
+from onyx.llm import (
+    TrustLLMExplainer,
+    _get_explainer,
+    explain_trust_signal_llm,
+    explain_trust_signal_llm_many,
+    is_trust_llm_configured,
+)
+
+
+def _sample_trust_data(**overrides: object) -> dict:
+    """Build a baseline trust_data payload for explainer tests."""
+    trust_data = {
+        "trust_score": 0.82,
+        "risk_level": "low",
+        "context_features": {
+            "device_reputation": 0.9,
+            "velocity": 2.0,
+            "ip_risk": 0.1,
+            "history_len": 25,
+        },
+        "rail_adjustments": [],
+    }
+    trust_data.update(overrides)
+    return trust_data
+
+
+def test_explainer_unconfigured_by_default() -> None:
+    """Test that the explainer reports unconfigured without Azure env vars."""
+    explainer = TrustLLMExplainer()
+
+    assert explainer.is_configured is False
+
+    status = explainer.get_configuration_status()
+    assert status["configured"] is False
+    assert status["endpoint_set"] is False
+    assert status["api_key_set"] is False
+    assert "api_version" in status
+
+
+def test_explain_trust_decision_clean_context() -> None:
+    """Test explanation for a clean, low-risk trust context."""
+    explainer = TrustLLMExplainer()
+    result = explainer.explain_trust_decision(_sample_trust_data())
+
+    assert "0.82" in result["explanation"]
+    assert "low" in result["explanation"]
+    assert result["key_factors"] == []
+    assert result["confidence"] == 0.95
+    assert result["model_used"] == "deterministic_stub"
+
+
+def test_explain_trust_decision_risky_context() -> None:
+    """Test explanation flags adverse factors for a risky context."""
+    explainer = TrustLLMExplainer()
+    trust_data = _sample_trust_data(
+        trust_score=0.25,
+        risk_level="high",
+        context_features={
+            "device_reputation": 0.2,
+            "velocity": 50.0,
+            "ip_risk": 0.9,
+            "history_len": 1,
+        },
+    )
+
+    result = explainer.explain_trust_decision(trust_data)
+
+    assert "low device reputation" in result["key_factors"]
+    assert "high transaction velocity" in result["key_factors"]
+    assert "elevated IP risk" in result["key_factors"]
+    assert "limited transaction history" in result["key_factors"]
+    assert result["confidence"] == 0.85
+
+
+def test_explain_trust_decision_malformed_payload() -> None:
+    """Test that an unparsable payload returns the error fallback."""
+    explainer = TrustLLMExplainer()
+
+    result = explainer.explain_trust_decision(_sample_trust_data(trust_score="oops"))
+    assert result["model_used"] == "error"
+    assert result["key_factors"] == []
+
+    # A non-mapping context_features fails the .get lookup, not coercion
+    result = explainer.explain_trust_decision({"context_features": "oops"})
+    assert result["model_used"] == "error"
+    assert "Unable to generate explanation" in result["explanation"]
+
+
+def test_explain_trust_decision_deterministic() -> None:
+    """Test that identical inputs produce identical explanations."""
+    explainer = TrustLLMExplainer()
+
+    first = explainer.explain_trust_decision(_sample_trust_data())
+    second = explainer.explain_trust_decision(_sample_trust_data())
+
+    assert first == second
+
+
+def test_module_helpers_share_one_explainer() -> None:
+    """Test that module-level helpers reuse a single cached explainer."""
+    assert _get_explainer() is _get_explainer()
+
+    assert is_trust_llm_configured() is False
+
+    result = explain_trust_signal_llm(_sample_trust_data())
+    assert result["model_used"] == "deterministic_stub"
+
+
+def test_explain_trust_decisions_batch_matches_single_calls() -> None:
+    """Test that batch explanation matches per-item explanation, in order."""
+    explainer = TrustLLMExplainer()
+    batch = [
+        _sample_trust_data(),
+        _sample_trust_data(trust_score=0.25, risk_level="high"),
+    ]
+
+    results = explainer.explain_trust_decisions(batch)
+
+    assert results == [explainer.explain_trust_decision(td) for td in batch]
+    assert explain_trust_signal_llm_many(batch) == results
+
+
+def test_semantic_cache_reuses_near_identical_contexts() -> None:
+    """Test that near-identical contexts hit the quantized explanation cache."""
+    TrustLLMExplainer.clear_cache()
+    explainer = TrustLLMExplainer()
+
+    first = explainer.explain_trust_decision(_sample_trust_data())
+    # Sub-quantization jitter in a feature maps to the same fingerprint
+    second = explainer.explain_trust_decision(
+        _sample_trust_data(
+            context_features={
+                "device_reputation": 0.91,
+                "velocity": 2.04,
+                "ip_risk": 0.12,
+                "history_len": 25,
+            }
+        )
+    )
+
+    assert first == second
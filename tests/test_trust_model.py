@@ -0,0 +1,140 @@
+"""
+Tests for the trust signal scoring model.
+"""
+
+from onyx.trust_model import (
+    TrustContext,
+    TrustSignalMLModel,
+    get_cache_stats,
+    get_trust_signal,
+)
+
+
+def _clean_context(**overrides: object) -> TrustContext:
+    """Build a baseline low-risk trust context."""
+    fields: dict = {
+        "user_id": "user-1",
+        "session_id": "session-1",
+        "device_reputation": 0.9,
+        "velocity": 2.0,
+        "ip_risk": 0.1,
+        "history_len": 50,
+    }
+    fields.update(overrides)
+    return TrustContext(**fields)
+
+
+def test_score_trust_deterministic() -> None:
+    """Test that identical contexts produce identical scores."""
+    model = TrustSignalMLModel(deterministic_seed=42)
+
+    first = model.score_trust(_clean_context())
+    second = model.score_trust(_clean_context())
+
+    assert first.trust_score == second.trust_score
+    assert first.risk_level == second.risk_level
+    assert first.feature_contributions == second.feature_contributions
+
+
+def test_score_trust_risk_levels() -> None:
+    """Test that clean and risky contexts land in different risk bands."""
+    model = TrustSignalMLModel(deterministic_seed=42)
+
+    clean = model.score_trust(_clean_context())
+    risky = model.score_trust(
+        _clean_context(device_reputation=0.1, velocity=20.0, ip_risk=0.9, history_len=1)
+    )
+
+    assert clean.trust_score > risky.trust_score
+    assert clean.risk_level in {"low", "medium"}
+    assert risky.risk_level == "high"
+    assert 0.0 <= clean.confidence <= 1.0
+
+
+def test_score_trust_batch_matches_single_calls() -> None:
+    """Test that batch scoring matches per-context scoring, in order."""
+    model = TrustSignalMLModel(deterministic_seed=42)
+    contexts = [
+        _clean_context(),
+        _clean_context(device_reputation=0.2, velocity=15.0, history_len=2),
+    ]
+
+    batch = model.score_trust_batch(contexts)
+
+    assert batch == [model.score_trust(context) for context in contexts]
+
+
+def test_calculate_rail_adjustments_normalized() -> None:
+    """Test that adjusted rail weights are normalized to sum to 1."""
+    model = TrustSignalMLModel(deterministic_seed=42)
+    weights = {"ACH": 0.4, "debit": 0.3, "credit": 0.3}
+
+    adjustments = model.calculate_rail_adjustments("high", weights)
+
+    assert {adj.rail_type for adj in adjustments} == set(weights)
+    assert abs(sum(adj.adjusted_weight for adj in adjustments) - 1.0) < 1e-9
+    ach = next(adj for adj in adjustments if adj.rail_type == "ACH")
+    assert ach.adjusted_weight < ach.original_weight
+
+
+def test_score_trust_outputs_stay_bounded() -> None:
+    """Test that unvalidated results keep the documented invariants."""
+    model = TrustSignalMLModel(deterministic_seed=42)
+    contexts = [
+        _clean_context(),
+        _clean_context(device_reputation=0.0, velocity=100.0, ip_risk=1.0),
+        _clean_context(
+            device_reputation=1.0, velocity=0.0, ip_risk=0.0, history_len=1000
+        ),
+        # history_len has no upper bound; huge values must still score
+        _clean_context(history_len=2**31),
+        _clean_context(history_len=2**70),
+    ]
+
+    for context in contexts:
+        result = model.score_trust(context)
+        assert 0.0 <= result.trust_score <= 1.0
+        assert 0.0 <= result.confidence <= 1.0
+        assert result.risk_level in {"low", "medium", "high"}
+
+        adjustments = model.calculate_rail_adjustments(
+            result.risk_level, {"ACH": 0.4, "debit": 0.3, "credit": 0.3}
+        )
+        assert abs(sum(adj.adjusted_weight for adj in adjustments) - 1.0) < 1e-9
+
+
+def test_generate_trust_explanation_mentions_factors() -> None:
+    """Test that the explanation surfaces the triggered risk factors."""
+    model = TrustSignalMLModel(deterministic_seed=42)
+    context = _clean_context(device_reputation=0.2, velocity=8.0, history_len=3)
+    result = model.score_trust(context)
+
+    explanation = model.generate_trust_explanation(context, result)
+
+    assert "low device reputation" in explanation
+    assert "high transaction velocity" in explanation
+    assert "limited history" in explanation
+
+
+def test_get_trust_signal_response_shape() -> None:
+    """Test the full trust signal response for a trace."""
+    response = get_trust_signal("trace-1", _clean_context())
+
+    assert response.trace_id == "trace-1"
+    assert 0.0 <= response.trust_score_result.trust_score <= 1.0
+    assert len(response.rail_adjustments) == 3
+    assert response.explanation
+    assert response.metadata["model_seed"] == 42
+    assert response.metadata["context_features"]["user_id"] == "user-1"
+
+
+def test_get_trust_signal_cache_reuse() -> None:
+    """Test that repeat scorings hit the cache with fresh trace IDs."""
+    first = get_trust_signal("trace-a", _clean_context())
+    hits_before = get_cache_stats()["hits"]
+    second = get_trust_signal("trace-b", _clean_context())
+
+    assert get_cache_stats()["hits"] == hits_before + 1
+    assert second.trace_id == "trace-b"
+    assert second.trust_score_result == first.trust_score_result
+    assert second.explanation == first.explanation
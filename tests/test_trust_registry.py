@@ -201,6 +201,17 @@ class TestTrustRegistry:
         assert "temp_provider_789" not in registry.list_providers()
         assert "trusted_bank_001" in registry.list_providers()
 
+    def test_version_unique_across_instances(self) -> None:
+        """Test that a fresh registry never reuses an earlier version."""
+        first = TrustRegistry()
+        first.add_provider("temp_provider_version")
+
+        # A rebuilt registry (as after clear_trust_registry_cache) must not
+        # collide with any version the first instance published, or caches
+        # keyed on the version would serve stale allowlist answers.
+        second = TrustRegistry()
+        assert second.version > first.version
+
     def test_get_stats(self) -> None:
         """Test getting registry statistics."""
         registry = TrustRegistry()
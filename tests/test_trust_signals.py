@@ -0,0 +1,145 @@
+"""
+Tests for trust signal CloudEvents.
+"""
+
+import json
+
+from onyx.trust_signals import (
+    TrustEventEmitter,
+    create_trust_signal_payload,
+    emit_trust_signal_event,
+    emit_trust_signal_event_dict,
+    get_trust_signal_event_schema,
+    serialize_event_json,
+    validate_trust_signal_event,
+)
+
+
+def _sample_trust_result(**overrides: object) -> dict:
+    """Build a baseline trust scoring result for trust signal tests."""
+    trust_result = {
+        "trace_id": "trace-123",
+        "trust_score_result": {
+            "trust_score": 0.82,
+            "risk_level": "low",
+            "confidence": 0.9,
+            "feature_contributions": {"device_reputation": 0.4, "velocity": 0.1},
+        },
+        "rail_adjustments": [
+            {"rail_type": "ACH", "adjusted_weight": 0.5},
+            {"rail_type": "Card", "adjusted_weight": 0.3},
+        ],
+    }
+    trust_result.update(overrides)
+    return trust_result
+
+
+def test_create_trust_signal_payload() -> None:
+    """Test payload creation from a trust scoring result."""
+    payload = create_trust_signal_payload(_sample_trust_result())
+
+    assert payload.trace_id == "trace-123"
+    assert payload.trust_score == 0.82
+    assert payload.risk_level == "low"
+    assert payload.confidence == 0.9
+    assert payload.adjusted_weights == {"ACH": 0.5, "Card": 0.3}
+    assert len(payload.rail_candidates) == 3
+
+
+def test_create_trust_signal_payload_unvalidated_matches() -> None:
+    """Test the validation-skipping fast path builds an identical payload."""
+    validated = create_trust_signal_payload(_sample_trust_result())
+    fast = create_trust_signal_payload(_sample_trust_result(), validate=False)
+
+    assert fast.trust_score == validated.trust_score
+    assert fast.adjusted_weights == validated.adjusted_weights
+    assert fast.rail_candidates == validated.rail_candidates
+
+
+def test_emit_trust_signal_event_valid() -> None:
+    """Test that emitted events validate against the schema checks."""
+    payload = create_trust_signal_payload(_sample_trust_result())
+    event = emit_trust_signal_event("trace-123", payload)
+
+    assert event.id.startswith("trust-signal-trace-123-")
+    assert event.subject == "trace-123"
+    assert validate_trust_signal_event(event) is True
+
+
+def test_validate_trust_signal_event_rejects_bad_data() -> None:
+    """Test validation failures for out-of-range and unknown values."""
+    payload = create_trust_signal_payload(
+        _sample_trust_result(
+            trust_score_result={
+                "trust_score": 1.5,
+                "risk_level": "low",
+                "confidence": 0.9,
+            }
+        )
+    )
+    event = emit_trust_signal_event("trace-123", payload)
+    assert validate_trust_signal_event(event) is False
+
+    payload = create_trust_signal_payload(_sample_trust_result())
+    payload.risk_level = "extreme"
+    event = emit_trust_signal_event("trace-123", payload)
+    assert validate_trust_signal_event(event) is False
+
+
+def test_serialize_event_json_roundtrip() -> None:
+    """Test that serialized events decode back to the same envelope."""
+    payload = create_trust_signal_payload(_sample_trust_result())
+    event = emit_trust_signal_event("trace-123", payload)
+
+    decoded = json.loads(serialize_event_json(event))
+    assert decoded["type"] == "ocn.onyx.trust_signal.v1"
+    assert decoded["id"] == event.id
+    assert decoded["data"]["trust_score"] == 0.82
+
+
+def test_emit_trust_signal_event_dict_matches_model_shape() -> None:
+    """Test the model-free emit path produces an equivalent envelope."""
+    event_dict = emit_trust_signal_event_dict("trace-123", _sample_trust_result())
+
+    assert event_dict["type"] == "ocn.onyx.trust_signal.v1"
+    assert event_dict["subject"] == "trace-123"
+    assert event_dict["id"].startswith("trust-signal-trace-123-")
+    assert event_dict["data"]["trust_score"] == 0.82
+    assert event_dict["data"]["adjusted_weights"] == {"ACH": 0.5, "Card": 0.3}
+
+
+def test_trust_event_emitter_batches_until_full() -> None:
+    """Test that the emitter buffers events and flushes a full batch."""
+    published: list[list[bytes]] = []
+    emitter = TrustEventEmitter(
+        publish=published.append, flush_every=3, linger_ms=60_000
+    )
+    payload = create_trust_signal_payload(_sample_trust_result())
+
+    assert emitter.emit(emit_trust_signal_event("t-1", payload)) == []
+    assert emitter.emit(emit_trust_signal_event("t-2", payload)) == []
+    batch = emitter.emit(emit_trust_signal_event("t-3", payload))
+
+    assert len(batch) == 3
+    assert published == [batch]
+    assert emitter.close() == []
+
+
+def test_trust_event_emitter_close_flushes_remainder() -> None:
+    """Test that close drains a partially filled buffer."""
+    emitter = TrustEventEmitter(flush_every=10, linger_ms=60_000)
+    payload = create_trust_signal_payload(_sample_trust_result())
+
+    emitter.emit(emit_trust_signal_event("t-1", payload))
+    batch = emitter.close()
+
+    assert len(batch) == 1
+    assert json.loads(batch[0])["subject"] == "t-1"
+
+
+def test_get_trust_signal_event_schema_cached() -> None:
+    """Test that the schema is built once and shared across calls."""
+    schema = get_trust_signal_event_schema()
+
+    assert schema["title"] == "ocn.onyx.trust_signal.v1"
+    assert get_trust_signal_event_schema() is schema